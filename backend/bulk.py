@@ -0,0 +1,61 @@
+"""Command line bulk export/import for the Lost & Found collections.
+
+    python bulk.py export lost_items -o lost_items.ndjson
+    python bulk.py export lost_items --fields id,title,status --after <last _id>
+    python bulk.py import messages messages.ndjson
+
+Typeahead suggestions live in the API server's memory, so restart the server
+after importing lost_items from here (or import through
+POST /api/admin/import/lost_items, which updates them in place).
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+from bson import ObjectId
+
+from server import BULK_COLLECTIONS, export_records, import_records
+
+async def run_export(args):
+    output = open(args.output, "w") if args.output else sys.stdout
+    fields = [field.strip() for field in args.fields.split(",")] if args.fields else None
+    try:
+        async for chunk in export_records(args.collection, fields, args.after):
+            output.write(chunk)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+async def run_import(args):
+    with open(args.input) as file:
+        stats = await import_records(args.collection, file)
+    print(json.dumps(stats, indent=2))
+    if args.collection == "lost_items":
+        print("Restart the API server to refresh typeahead suggestions", file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk export/import Lost & Found data as NDJSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    export_parser = commands.add_parser("export", help="Stream a collection to NDJSON")
+    export_parser.add_argument("collection", choices=BULK_COLLECTIONS)
+    export_parser.add_argument("-o", "--output", help="Output file (defaults to stdout)")
+    export_parser.add_argument("--fields", help="Comma separated fields to export")
+    export_parser.add_argument("--after", help="Resume after this _id")
+    
+    import_parser = commands.add_parser("import", help="Import NDJSON records into a collection")
+    import_parser.add_argument("collection", choices=BULK_COLLECTIONS)
+    import_parser.add_argument("input", help="NDJSON file to import")
+    
+    args = parser.parse_args()
+    if args.command == "export" and args.after and not ObjectId.is_valid(args.after):
+        parser.error(f"invalid resume token: {args.after}")
+    
+    if args.command == "export":
+        asyncio.run(run_export(args))
+    else:
+        asyncio.run(run_import(args))
+
+if __name__ == "__main__":
+    main()
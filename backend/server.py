@@ -2,8 +2,9 @@ from fastapi import FastAPI, HTTPException, Depends, File, UploadFile, Form
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.encoders import jsonable_encoder
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
+from typing import Optional, List, Literal, Callable, IO
 from datetime import datetime, timedelta
 import os
 import uuid
@@ -14,9 +15,18 @@ import base64
 from PIL import Image
 import io
 import json
+import logging
+import asyncio
+import bisect
+import heapq
+import hmac
+from collections import Counter
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo.errors import BulkWriteError
 
 app = FastAPI(title="Lost & Found API", version="1.0.0")
+logger = logging.getLogger(__name__)
 
 # CORS Configuration
 app.add_middleware(
@@ -36,6 +46,25 @@ db = client.lost_found_db
 security = HTTPBearer()
 JWT_SECRET = os.getenv("JWT_SECRET", "your-super-secret-jwt-key-change-in-production")
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID", "")
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+# Item Lifecycle Configuration
+ITEM_EXPIRY_DAYS = int(os.getenv("ITEM_EXPIRY_DAYS", "90"))
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "500"))
+ARCHIVE_INTERVAL_SECONDS = int(os.getenv("ARCHIVE_INTERVAL_SECONDS", "3600"))
+
+# Typeahead Configuration
+SUGGEST_FIELDS = ("title", "location")
+SUGGEST_MAX_LIMIT = 20
+SUGGEST_MIN_LENGTH = 2
+
+# Bulk Export/Import Configuration
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+EXPORT_CHUNK_BYTES = int(os.getenv("EXPORT_CHUNK_BYTES", str(1024 * 1024)))
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "1000"))
+IMPORT_BATCH_BYTES = int(os.getenv("IMPORT_BATCH_BYTES", str(8 * 1024 * 1024)))
+IMPORT_MAX_IN_FLIGHT = int(os.getenv("IMPORT_MAX_IN_FLIGHT", "4"))
+IMPORT_MAX_ERRORS = 20
 
 # Models
 class User(BaseModel):
@@ -59,10 +88,15 @@ class LostItem(BaseModel):
     location: str
     date_lost: datetime
     images: List[str] = []
-    status: str = "active"  # active, found, closed
+    status: Literal["active", "found", "closed"] = "active"
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: Optional[datetime] = None
+    closed_at: Optional[datetime] = None
     contact_info: Optional[str] = None
 
+class ArchivedItem(LostItem):
+    archived_at: datetime = Field(default_factory=datetime.utcnow)
+
 class Message(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     sender_id: str
@@ -72,6 +106,83 @@ class Message(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     read: bool = False
 
+class PrefixIndex:
+    """In-memory typeahead index over field values of active items.
+
+    Every word-suffix of a value is kept in a sorted array so a prefix lookup
+    is a bisect plus a scan of the matching range, and "wallet" completes
+    "Black Wallet" as well as "Wallet". Values are ranked by how many active
+    items carry them.
+    """
+
+    def __init__(self):
+        self.keys = []    # sorted (suffix, value) pairs
+        self.counts = {}  # value -> number of active items
+        self.labels = {}  # value -> display text
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return " ".join(text.lower().split())
+
+    @staticmethod
+    def suffixes(value: str) -> List[str]:
+        words = value.split(" ")
+        return [" ".join(words[i:]) for i in range(len(words))]
+
+    @classmethod
+    def build(cls, texts: Counter) -> "PrefixIndex":
+        """Build an index in one sort from raw text frequencies"""
+        index = cls()
+        for text, count in texts.items():
+            value = cls.normalize(text)
+            if not value:
+                continue
+            if value not in index.counts:
+                index.counts[value] = 0
+                index.labels[value] = " ".join(text.split())
+            index.counts[value] += count
+        index.keys = sorted(
+            (suffix, value) for value in index.counts for suffix in cls.suffixes(value)
+        )
+        return index
+
+    def add(self, text: str):
+        value = self.normalize(text)
+        if not value:
+            return
+        if value not in self.counts:
+            self.counts[value] = 0
+            self.labels[value] = " ".join(text.split())
+            for suffix in self.suffixes(value):
+                bisect.insort(self.keys, (suffix, value))
+        self.counts[value] += 1
+
+    def remove(self, text: str):
+        value = self.normalize(text)
+        if value not in self.counts:
+            return
+        self.counts[value] -= 1
+        if self.counts[value] > 0:
+            return
+        del self.counts[value]
+        del self.labels[value]
+        for suffix in self.suffixes(value):
+            position = bisect.bisect_left(self.keys, (suffix, value))
+            if position < len(self.keys) and self.keys[position] == (suffix, value):
+                del self.keys[position]
+
+    def suggest(self, prefix: str, limit: int) -> List[dict]:
+        prefix = self.normalize(prefix)
+        if not prefix:
+            return []
+        matches = set()
+        position = bisect.bisect_left(self.keys, (prefix,))
+        while position < len(self.keys) and self.keys[position][0].startswith(prefix):
+            matches.add(self.keys[position][1])
+            position += 1
+        top = heapq.nsmallest(limit, matches, key=lambda value: (-self.counts[value], value))
+        return [{"text": self.labels[value], "count": self.counts[value]} for value in top]
+
 # Categories Data
 CATEGORIES = [
     {"id": "electronics", "name": "Electronics", "icon": "📱"},
@@ -84,6 +195,21 @@ CATEGORIES = [
     {"id": "other", "name": "Other", "icon": "📦"}
 ]
 
+# Collections available for bulk export/import and the models records must match
+BULK_COLLECTIONS = {
+    "lost_items": LostItem,
+    "archived_items": ArchivedItem,
+    "users": User,
+    "messages": Message
+}
+
+# Allowed status transitions (closed items are archived, so closed is terminal)
+STATUS_TRANSITIONS = {
+    "active": ["found", "closed"],
+    "found": ["active", "closed"],
+    "closed": []
+}
+
 # Helper Functions
 def convert_objectid_to_str(obj):
     """Convert MongoDB ObjectId to string recursively"""
@@ -109,6 +235,12 @@ async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(secur
     except jwt.JWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+async def verify_admin(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin access is not configured")
+    if not hmac.compare_digest(credentials.credentials.encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
 def create_jwt_token(user_id: str) -> str:
     payload = {
         "user_id": user_id,
@@ -167,6 +299,237 @@ def process_image(image_data: bytes) -> str:
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Image processing failed: {str(e)}")
 
+async def ensure_indexes():
+    """Create indexes for the hot and archive item collections"""
+    await db.lost_items.create_index("id", unique=True)
+    await db.lost_items.create_index([("status", 1), ("date_lost", 1)])
+    await db.lost_items.create_index("user_id")
+    await db.archived_items.create_index("id", unique=True)
+    await db.archived_items.create_index("user_id")
+
+async def expire_stale_items(query: Optional[dict] = None) -> int:
+    """Close open items lost more than ITEM_EXPIRY_DAYS ago, optionally narrowed by query"""
+    now = datetime.utcnow()
+    cutoff = now - timedelta(days=ITEM_EXPIRY_DAYS)
+    stale_query = {**(query or {}), "date_lost": {"$lt": cutoff}}
+    update = {"$set": {"status": "closed", "closed_at": now, "updated_at": now}}
+    
+    found = await db.lost_items.update_many({**stale_query, "status": "found"}, update)
+    expired = found.modified_count
+    
+    # Active items are closed in batches so they can be dropped from the typeahead
+    # indexes. Reading back by closed_at keeps only the items this call closed.
+    projection = {"_id": 1, **{field: 1 for field in SUGGEST_FIELDS}}
+    while True:
+        batch = await db.lost_items.find(
+            {**stale_query, "status": "active"}, {"_id": 1}
+        ).limit(ARCHIVE_BATCH_SIZE).to_list(length=ARCHIVE_BATCH_SIZE)
+        if not batch:
+            break
+        
+        ids = [item["_id"] for item in batch]
+        await db.lost_items.update_many({"_id": {"$in": ids}, "status": "active"}, update)
+        async for item in db.lost_items.find({"_id": {"$in": ids}, "closed_at": now}, projection):
+            index_item_suggestions(item, add=False)
+            expired += 1
+    
+    return expired
+
+async def archive_closed_items(query: Optional[dict] = None) -> int:
+    """Move closed items from lost_items into archived_items in batches.
+
+    Documents embed their images, so the copy runs inside the database with
+    $merge and only _ids are loaded into this process.
+    """
+    archived = 0
+    while True:
+        batch = await db.lost_items.find(
+            {**(query or {}), "status": "closed"}, {"_id": 1}
+        ).limit(ARCHIVE_BATCH_SIZE).to_list(length=ARCHIVE_BATCH_SIZE)
+        if not batch:
+            break
+        
+        ids = [item["_id"] for item in batch]
+        
+        # keepExisting skips copies left over from an interrupted run
+        await db.lost_items.aggregate([
+            {"$match": {"_id": {"$in": ids}, "status": "closed"}},
+            {"$addFields": {"archived_at": datetime.utcnow()}},
+            {"$merge": {"into": "archived_items", "on": "_id", "whenMatched": "keepExisting", "whenNotMatched": "insert"}}
+        ]).to_list(length=None)
+        
+        await db.lost_items.delete_many({"_id": {"$in": ids}, "status": "closed"})
+        archived += len(batch)
+        
+        if len(batch) < ARCHIVE_BATCH_SIZE:
+            break
+    
+    return archived
+
+async def run_lifecycle_worker():
+    """Periodically expire stale items and archive closed ones"""
+    while True:
+        try:
+            expired = await expire_stale_items()
+            archived = await archive_closed_items()
+            if expired or archived:
+                logger.info("Lifecycle worker expired %d items, archived %d items", expired, archived)
+        except Exception:
+            logger.exception("Lifecycle worker failed")
+        
+        await asyncio.sleep(ARCHIVE_INTERVAL_SECONDS)
+
+@app.on_event("startup")
+async def start_lifecycle_worker():
+    await ensure_indexes()
+    await build_suggest_indexes()
+    app.state.lifecycle_task = asyncio.create_task(run_lifecycle_worker())
+
+@app.on_event("shutdown")
+async def stop_lifecycle_worker():
+    app.state.lifecycle_task.cancel()
+
+# Typeahead indexes, rebuilt on startup and kept current on writes
+suggest_indexes = {field: PrefixIndex() for field in SUGGEST_FIELDS}
+
+async def build_suggest_indexes():
+    """Rebuild typeahead indexes from a projected scan of active items"""
+    texts = {field: Counter() for field in SUGGEST_FIELDS}
+    projection = {"_id": 0, **{field: 1 for field in SUGGEST_FIELDS}}
+    async for item in db.lost_items.find({"status": "active"}, projection):
+        for field in SUGGEST_FIELDS:
+            texts[field][item.get(field) or ""] += 1
+    suggest_indexes.update({field: PrefixIndex.build(texts[field]) for field in SUGGEST_FIELDS})
+
+def index_item_suggestions(item: dict, add: bool = True):
+    """Add or remove an item's values in the typeahead indexes"""
+    for field in SUGGEST_FIELDS:
+        if add:
+            suggest_indexes[field].add(item.get(field) or "")
+        else:
+            suggest_indexes[field].remove(item.get(field) or "")
+
+async def export_records(collection: str, fields: Optional[List[str]] = None, after: Optional[str] = None):
+    """Stream a collection as NDJSON chunks in _id order.
+
+    Each record carries its _id, so the last _id received can be passed back
+    as ``after`` to resume an interrupted export.
+    """
+    query = {"_id": {"$gt": ObjectId(after)}} if after else {}
+    projection = {field: 1 for field in fields} if fields else None
+    cursor = db[collection].find(query, projection).sort("_id", 1).batch_size(EXPORT_BATCH_SIZE)
+    
+    # Flush by size rather than record count, since items embed their images
+    lines = []
+    size = 0
+    async for record in cursor:
+        line = json.dumps(jsonable_encoder(convert_objectid_to_str(record))) + "\n"
+        lines.append(line)
+        size += len(line)
+        if size >= EXPORT_CHUNK_BYTES:
+            yield "".join(lines)
+            lines = []
+            size = 0
+    if lines:
+        yield "".join(lines)
+
+async def import_records(
+    collection: str,
+    file: IO,
+    on_inserted: Optional[Callable[[List[dict]], None]] = None
+) -> dict:
+    """Validate NDJSON lines from a file against the collection model and insert them in batches.
+
+    Batches close at IMPORT_BATCH_SIZE records or IMPORT_BATCH_BYTES of input,
+    whichever comes first, and are written with unordered insert_many, at most
+    IMPORT_MAX_IN_FLIGHT at a time, so reading pauses while the database
+    catches up. The file is read in a thread to keep the event loop free. Records that
+    keep their exported _id are skipped as duplicates when re-imported.
+    ``on_inserted`` is called with the documents each batch actually wrote.
+    """
+    model = BULK_COLLECTIONS[collection]
+    stats = {"inserted": 0, "duplicates": 0, "invalid": 0, "errors": []}
+    pending = set()
+    
+    def record_error(line_number: Optional[int], error: str):
+        stats["invalid"] += 1
+        if len(stats["errors"]) < IMPORT_MAX_ERRORS:
+            stats["errors"].append({"line": line_number, "error": error})
+    
+    async def write_batch(batch: List[dict]):
+        try:
+            result = await db[collection].insert_many(batch, ordered=False)
+            stats["inserted"] += len(result.inserted_ids)
+            failed = set()
+        except BulkWriteError as e:
+            stats["inserted"] += e.details.get("nInserted", 0)
+            failed = {error["index"] for error in e.details.get("writeErrors", [])}
+            for error in e.details.get("writeErrors", []):
+                if error.get("code") == 11000:
+                    stats["duplicates"] += 1
+                else:
+                    record_error(None, error.get("errmsg", "Write failed"))
+        
+        if on_inserted:
+            on_inserted([document for index, document in enumerate(batch) if index not in failed])
+    
+    async def submit(batch: List[dict]):
+        if len(pending) >= IMPORT_MAX_IN_FLIGHT:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            pending.difference_update(done)
+            for task in done:
+                task.result()
+        pending.add(asyncio.create_task(write_batch(batch)))
+    
+    batch = []
+    batch_bytes = 0
+    line_number = 0
+    try:
+        while True:
+            lines = await asyncio.to_thread(file.readlines, IMPORT_BATCH_BYTES)
+            if not lines:
+                break
+            
+            for line in lines:
+                line_number += 1
+                try:
+                    if isinstance(line, bytes):
+                        line = line.decode()
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    if not isinstance(record, dict):
+                        raise ValueError("Record must be a JSON object")
+                    object_id = record.pop("_id", None)
+                    document = model(**record).dict()
+                    if object_id:
+                        document["_id"] = ObjectId(object_id)
+                except (ValueError, TypeError, InvalidId, ValidationError) as e:
+                    record_error(line_number, str(e))
+                    continue
+                
+                batch.append(document)
+                batch_bytes += len(line)
+                if len(batch) >= IMPORT_BATCH_SIZE or batch_bytes >= IMPORT_BATCH_BYTES:
+                    await submit(batch)
+                    batch = []
+                    batch_bytes = 0
+            
+            # Release this chunk before the next read rather than holding two
+            lines = None
+        
+        if batch:
+            await submit(batch)
+        if pending:
+            await asyncio.gather(*pending)
+    except BaseException:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        raise
+    
+    return stats
+
 # API Routes
 @app.get("/api/health")
 async def health_check():
@@ -244,6 +607,7 @@ async def report_lost_item(
     )
     
     await db.lost_items.insert_one(lost_item.dict())
+    index_item_suggestions(lost_item.dict())
     
     return {"message": "Lost item reported successfully", "item_id": lost_item.id}
 
@@ -287,10 +651,32 @@ async def get_lost_items(
         "pages": (total + limit - 1) // limit
     }
 
+@app.get("/api/suggest")
+async def get_suggestions(field: str, q: str = "", limit: int = 8):
+    """Get typeahead completions for item titles or locations"""
+    if field not in suggest_indexes:
+        raise HTTPException(status_code=400, detail=f"Invalid field: {field}")
+    
+    limit = max(1, min(limit, SUGGEST_MAX_LIMIT))
+    
+    # Very short prefixes match most of the index, so they are not worth scanning
+    suggestions = []
+    if len(PrefixIndex.normalize(q)) >= SUGGEST_MIN_LENGTH:
+        suggestions = suggest_indexes[field].suggest(q, limit)
+    
+    return {
+        "field": field,
+        "query": q,
+        "suggestions": suggestions
+    }
+
 @app.get("/api/items/lost/{item_id}")
 async def get_lost_item(item_id: str):
     """Get specific lost item details"""
     item = await db.lost_items.find_one({"id": item_id})
+    if not item:
+        # Closed items are moved out of the hot collection by the lifecycle worker
+        item = await db.archived_items.find_one({"id": item_id})
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
     
@@ -307,6 +693,53 @@ async def get_lost_item(item_id: str):
     
     return item
 
+@app.put("/api/items/lost/{item_id}/status")
+async def update_item_status(
+    item_id: str,
+    status: str = Form(...),
+    user_id: str = Depends(verify_token)
+):
+    """Change the status of a lost item owned by the current user"""
+    if status not in STATUS_TRANSITIONS:
+        raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
+    
+    item = await db.lost_items.find_one(
+        {"id": item_id},
+        {"user_id": 1, "status": 1, **{field: 1 for field in SUGGEST_FIELDS}}
+    )
+    if not item:
+        if await db.archived_items.find_one({"id": item_id}, {"_id": 1}):
+            raise HTTPException(status_code=409, detail="Item is archived and can no longer be changed")
+        raise HTTPException(status_code=404, detail="Item not found")
+    
+    if item["user_id"] != user_id:
+        raise HTTPException(status_code=403, detail="Only the owner can change the item status")
+    
+    if status not in STATUS_TRANSITIONS.get(item["status"], []):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot change status from {item['status']} to {status}"
+        )
+    
+    now = datetime.utcnow()
+    update = {"status": status, "updated_at": now}
+    if status == "closed":
+        update["closed_at"] = now
+    
+    # Match on the previous status so concurrent transitions cannot both apply
+    result = await db.lost_items.update_one(
+        {"id": item_id, "status": item["status"]},
+        {"$set": update}
+    )
+    if result.modified_count == 0:
+        raise HTTPException(status_code=409, detail="Item status was changed concurrently")
+    
+    # Only active items are offered as suggestions
+    if item["status"] == "active" or status == "active":
+        index_item_suggestions(item, add=status == "active")
+    
+    return {"message": "Item status updated successfully", "item_id": item_id, "status": status}
+
 @app.post("/api/messages")
 async def send_message(
     receiver_id: str = Form(...),
@@ -372,6 +805,7 @@ async def get_profile(user_id: str = Depends(verify_token)):
     # Get user's lost items
     lost_items_cursor = db.lost_items.find({"user_id": user_id})
     lost_items = await lost_items_cursor.to_list(length=100)
+    archived_count = await db.archived_items.count_documents({"user_id": user_id})
     
     # Convert ObjectId to string
     user = convert_objectid_to_str(user)
@@ -381,12 +815,51 @@ async def get_profile(user_id: str = Depends(verify_token)):
         "user": user,
         "lost_items": lost_items,
         "stats": {
-            "total_reported": len(lost_items),
+            "total_reported": len(lost_items) + archived_count,
             "active_items": len([item for item in lost_items if item["status"] == "active"]),
-            "found_items": len([item for item in lost_items if item["status"] == "found"])
+            "found_items": len([item for item in lost_items if item["status"] == "found"]),
+            "archived_items": archived_count
         }
     }
 
+@app.get("/api/admin/export/{collection}", dependencies=[Depends(verify_admin)])
+async def export_collection(
+    collection: str,
+    fields: Optional[str] = None,
+    after: Optional[str] = None
+):
+    """Stream a collection as NDJSON"""
+    if collection not in BULK_COLLECTIONS:
+        raise HTTPException(status_code=400, detail=f"Invalid collection: {collection}")
+    
+    if after and not ObjectId.is_valid(after):
+        raise HTTPException(status_code=400, detail="Invalid resume token")
+    
+    field_list = [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+    
+    return StreamingResponse(
+        export_records(collection, field_list, after),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f"attachment; filename={collection}.ndjson"}
+    )
+
+@app.post("/api/admin/import/{collection}", dependencies=[Depends(verify_admin)])
+async def import_collection(collection: str, file: UploadFile = File(...)):
+    """Import NDJSON records into a collection"""
+    if collection not in BULK_COLLECTIONS:
+        raise HTTPException(status_code=400, detail=f"Invalid collection: {collection}")
+    
+    def index_active_items(documents: List[dict]):
+        for document in documents:
+            if document["status"] == "active":
+                index_item_suggestions(document)
+    
+    return await import_records(
+        collection,
+        file.file,
+        on_inserted=index_active_items if collection == "lost_items" else None
+    )
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
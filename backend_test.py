@@ -47,6 +47,31 @@ class LostAndFoundAPITest(unittest.TestCase):
         """Get headers with auth token"""
         return {"Authorization": f"Bearer {self.token}"} if self.token else {}
     
+    def report_test_item(self, title, date_lost=None):
+        """Report a lost item with a generated image and return its ID"""
+        from PIL import Image
+        import io
+        
+        img = Image.new('RGB', (400, 400), color = 'blue')
+        img_byte_arr = io.BytesIO()
+        img.save(img_byte_arr, format='JPEG')
+        img_byte_arr.seek(0)
+        
+        response = requests.post(
+            f"{self.base_url}/api/items/lost",
+            files={'images': ('test_image.jpg', img_byte_arr, 'image/jpeg')},
+            data={
+                'title': title,
+                'description': 'This is a test item created by automated testing',
+                'category_id': 'keys',
+                'location': 'Test Location',
+                'date_lost': date_lost or datetime.now().strftime("%Y-%m-%d")
+            },
+            headers=self.get_auth_headers()
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()["item_id"]
+    
     def test_01_health_check(self):
         """Test health check endpoint"""
         print(f"\n🔍 Testing health check endpoint...")
@@ -322,6 +347,252 @@ class LostAndFoundAPITest(unittest.TestCase):
             except Exception as e:
                 print(f"❌ Unauthorized test failed for {endpoint['url']}: {str(e)}")
 
+    def test_10_update_item_status(self):
+        """Test item status transitions"""
+        print(f"\n🔍 Testing update item status endpoint...")
+        
+        if not self.token:
+            self.skipTest("No auth token available")
+        
+        try:
+            item_id = self.report_test_item('Test Status Item')
+            status_url = f"{self.base_url}/api/items/lost/{item_id}/status"
+            
+            # Unknown status is rejected
+            response = requests.put(status_url, data={'status': 'lost'}, headers=self.get_auth_headers())
+            self.assertEqual(response.status_code, 400)
+            
+            # active -> found -> closed
+            response = requests.put(status_url, data={'status': 'found'}, headers=self.get_auth_headers())
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["status"], "found")
+            
+            response = requests.put(status_url, data={'status': 'closed'}, headers=self.get_auth_headers())
+            self.assertEqual(response.status_code, 200)
+            
+            # closed is terminal
+            response = requests.put(status_url, data={'status': 'active'}, headers=self.get_auth_headers())
+            self.assertEqual(response.status_code, 400)
+            
+            response = requests.get(f"{self.base_url}/api/items/lost/{item_id}")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["status"], "closed")
+            
+            print(f"✅ Update item status passed - Item ID: {item_id}")
+            
+        except Exception as e:
+            self.fail(f"Update item status failed: {str(e)}")
+
+    def test_11_suggest(self):
+        """Test typeahead suggestions endpoint"""
+        print(f"\n🔍 Testing suggest endpoint...")
+        
+        if not self.token:
+            self.skipTest("No auth token available")
+        
+        try:
+            import uuid
+            tag = f"suggest{uuid.uuid4().hex[:12]}"
+            suggest_url = f"{self.base_url}/api/suggest?field=title&q={tag}"
+            
+            self.report_test_item(f"{tag} Alpha")
+            self.report_test_item(f"{tag} Alpha")
+            beta_id = self.report_test_item(f"{tag} Beta")
+            
+            # Reported items show up, ranked by frequency
+            response = requests.get(suggest_url)
+            self.assertEqual(response.status_code, 200)
+            suggestions = response.json()["suggestions"]
+            self.assertEqual(
+                suggestions,
+                [{"text": f"{tag} Alpha", "count": 2}, {"text": f"{tag} Beta", "count": 1}]
+            )
+            
+            # Later words in a title also match
+            response = requests.get(f"{self.base_url}/api/suggest?field=title&q=beta&limit=20")
+            self.assertEqual(response.status_code, 200)
+            self.assertIn(f"{tag} Beta", [suggestion["text"] for suggestion in response.json()["suggestions"]])
+            
+            # Items that are no longer active are not suggested
+            response = requests.put(
+                f"{self.base_url}/api/items/lost/{beta_id}/status",
+                data={'status': 'found'},
+                headers=self.get_auth_headers()
+            )
+            self.assertEqual(response.status_code, 200)
+            
+            response = requests.get(suggest_url)
+            self.assertEqual(response.json()["suggestions"], [{"text": f"{tag} Alpha", "count": 2}])
+            
+            response = requests.get(f"{self.base_url}/api/suggest?field=title&q={tag}&limit=1")
+            self.assertEqual(len(response.json()["suggestions"]), 1)
+            
+            response = requests.get(f"{self.base_url}/api/suggest?field=description&q=test")
+            self.assertEqual(response.status_code, 400)
+            
+            print(f"✅ Suggest passed - Found {len(suggestions)} title suggestions")
+            
+        except Exception as e:
+            self.fail(f"Suggest failed: {str(e)}")
+    
+    def test_12_bulk_export_import(self):
+        """Test NDJSON bulk export and import"""
+        print(f"\n🔍 Testing bulk export/import endpoints...")
+        
+        admin_token = os.environ.get("ADMIN_TOKEN")
+        if not admin_token:
+            self.skipTest("ADMIN_TOKEN not set")
+        admin_headers = {"Authorization": f"Bearer {admin_token}"}
+        
+        try:
+            response = requests.get(
+                f"{self.base_url}/api/admin/export/lost_items?fields=id,title",
+                headers=admin_headers
+            )
+            self.assertEqual(response.status_code, 200)
+            records = [json.loads(line) for line in response.text.splitlines() if line]
+            for record in records:
+                self.assertIn("_id", record)
+                self.assertNotIn("images", record)
+            
+            # Resuming after the first record skips it
+            if records:
+                response = requests.get(
+                    f"{self.base_url}/api/admin/export/lost_items?after={records[0]['_id']}",
+                    headers=admin_headers
+                )
+                self.assertEqual(response.status_code, 200)
+                self.assertNotIn(records[0]["_id"], response.text)
+            
+            ndjson = "\n".join([
+                json.dumps({
+                    "sender_id": "bulk-sender",
+                    "receiver_id": "bulk-receiver",
+                    "item_id": "bulk-item",
+                    "content": "Imported by automated testing"
+                }),
+                json.dumps({"sender_id": "missing-fields"}),
+                "not json",
+                "42",
+                json.dumps([1, 2])
+            ])
+            response = requests.post(
+                f"{self.base_url}/api/admin/import/messages",
+                files={'file': ('messages.ndjson', ndjson, 'application/x-ndjson')},
+                headers=admin_headers
+            )
+            self.assertEqual(response.status_code, 200)
+            result = response.json()
+            self.assertEqual(result["inserted"], 1)
+            self.assertEqual(result["invalid"], 4)
+            
+            # Unknown item statuses are rejected
+            ndjson = json.dumps({
+                "user_id": "bulk-user",
+                "title": "Bulk Item",
+                "description": "Imported by automated testing",
+                "category_id": "other",
+                "location": "Test Location",
+                "date_lost": datetime.now().isoformat(),
+                "status": "lost"
+            })
+            response = requests.post(
+                f"{self.base_url}/api/admin/import/lost_items",
+                files={'file': ('lost_items.ndjson', ndjson, 'application/x-ndjson')},
+                headers=admin_headers
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["inserted"], 0)
+            self.assertEqual(response.json()["invalid"], 1)
+            
+            # Archived items are exported too
+            response = requests.get(
+                f"{self.base_url}/api/admin/export/archived_items?fields=id",
+                headers=admin_headers
+            )
+            self.assertEqual(response.status_code, 200)
+            
+            print(f"✅ Bulk export/import passed - Exported {len(records)} items")
+            
+        except Exception as e:
+            self.fail(f"Bulk export/import failed: {str(e)}")
+
+    def test_13_lifecycle_archiving(self):
+        """Test expiry and archiving of stale items"""
+        print(f"\n🔍 Testing item lifecycle worker...")
+        
+        if not self.token:
+            self.skipTest("No auth token available")
+        
+        try:
+            import asyncio
+            import sys
+            sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+            import server
+        except ImportError as e:
+            self.skipTest(f"Backend dependencies not available: {str(e)}")
+        
+        try:
+            old_date = "2000-01-01"
+            item_ids = [
+                self.report_test_item('Test Stale Item 1', date_lost=old_date),
+                self.report_test_item('Test Stale Item 2', date_lost=old_date)
+            ]
+            
+            # Only touch this test's items, never other stale data in the database
+            scope = {"id": {"$in": item_ids}}
+            
+            async def run_lifecycle():
+                # The server under test must be backed by the database this process reaches
+                if not await server.db.lost_items.find_one({"id": item_ids[0]}, {"_id": 1}):
+                    return False
+                
+                expired = await server.expire_stale_items(scope)
+                self.assertEqual(expired, 2)
+                
+                # Simulate a previous run that copied an item but died before deleting it
+                copied = await server.db.lost_items.find_one({"id": item_ids[0]})
+                self.assertEqual(copied["status"], "closed")
+                await server.db.archived_items.insert_one(copied)
+                
+                # A batch size of 1 exercises the batching loop
+                batch_size = server.ARCHIVE_BATCH_SIZE
+                server.ARCHIVE_BATCH_SIZE = 1
+                try:
+                    archived = await server.archive_closed_items(scope)
+                finally:
+                    server.ARCHIVE_BATCH_SIZE = batch_size
+                self.assertEqual(archived, 2)
+                
+                for item_id in item_ids:
+                    self.assertIsNone(await server.db.lost_items.find_one({"id": item_id}))
+                    self.assertIsNotNone(await server.db.archived_items.find_one({"id": item_id}))
+                return True
+            
+            if not asyncio.run(run_lifecycle()):
+                self.skipTest("MONGO_URL does not point at the database behind the backend URL")
+            
+            # Archived items are still served by id
+            for item_id in item_ids:
+                response = requests.get(f"{self.base_url}/api/items/lost/{item_id}")
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json()["status"], "closed")
+            
+            # Archived items can no longer change status
+            response = requests.put(
+                f"{self.base_url}/api/items/lost/{item_ids[0]}/status",
+                data={'status': 'active'},
+                headers=self.get_auth_headers()
+            )
+            self.assertEqual(response.status_code, 409)
+            
+            print(f"✅ Lifecycle archiving passed - Archived {len(item_ids)} items")
+            
+        except unittest.SkipTest:
+            raise
+        except Exception as e:
+            self.fail(f"Lifecycle archiving failed: {str(e)}")
+
 if __name__ == "__main__":
     # Run the tests
     unittest.main(argv=['first-arg-is-ignored'], exit=False)
\ No newline at end of file
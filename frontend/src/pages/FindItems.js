@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo, useRef } from 'react';
 import { Link } from 'react-router-dom';
 import { itemsAPI } from '../services/api';
 import { 
@@ -14,6 +14,8 @@ import {
 } from 'lucide-react';
 import { formatRelativeTime, getCategoryIcon, debounce } from '../utils/helpers';
 
+const SUGGEST_MIN_LENGTH = 2;
+
 const FindItems = () => {
   const [items, setItems] = useState([]);
   const [categories, setCategories] = useState([]);
@@ -22,6 +24,9 @@ const FindItems = () => {
   const [showFilters, setShowFilters] = useState(false);
   
   const [searchTerm, setSearchTerm] = useState('');
+  const [searchInput, setSearchInput] = useState('');
+  const [locationInput, setLocationInput] = useState('');
+  const [suggestions, setSuggestions] = useState({ title: [], location: [] });
   const [filters, setFilters] = useState({
     category: '',
     location: '',
@@ -38,6 +43,35 @@ const FindItems = () => {
   // Debounced search
   const debouncedSearch = debounce(fetchItems, 500);
 
+  // Typeahead lookups are served from memory, so they can run on every keystroke
+  const latestQuery = useRef({ title: '', location: '' });
+
+  const fetchSuggestions = async (field, q) => {
+    try {
+      const response = await itemsAPI.getSuggestions(field, q);
+      // Drop responses for input that has changed since the request was sent
+      if (latestQuery.current[field] === q) {
+        setSuggestions(prev => ({ ...prev, [field]: response.data.suggestions }));
+      }
+    } catch (error) {
+      console.error('Failed to fetch suggestions:', error);
+    }
+  };
+
+  const debouncedSuggest = useMemo(() => ({
+    title: debounce(q => fetchSuggestions('title', q), 100),
+    location: debounce(q => fetchSuggestions('location', q), 100),
+  }), []);
+
+  const requestSuggestions = (field, q) => {
+    latestQuery.current[field] = q;
+    if (q.trim().length < SUGGEST_MIN_LENGTH) {
+      setSuggestions(prev => ({ ...prev, [field]: [] }));
+      return;
+    }
+    debouncedSuggest[field](q);
+  };
+
   useEffect(() => {
     fetchCategories();
     fetchItems();
@@ -81,11 +115,44 @@ const FindItems = () => {
     }
   };
 
-  const handleSearchChange = (e) => {
-    setSearchTerm(e.target.value);
+  const commitSearch = (value) => {
+    setSearchTerm(value);
     setPagination(prev => ({ ...prev, page: 1 }));
   };
 
+  const handleSearchChange = (e) => {
+    const value = e.target.value;
+    setSearchInput(value);
+    requestSuggestions('title', value);
+
+    // Run the full search only when a suggestion is picked or the box is cleared
+    if (!value || suggestions.title.some(suggestion => suggestion.text === value)) {
+      commitSearch(value);
+    }
+  };
+
+  const handleSearchSubmit = (e) => {
+    e.preventDefault();
+    commitSearch(searchInput);
+  };
+
+  const handleLocationChange = (e) => {
+    const value = e.target.value;
+    setLocationInput(value);
+    requestSuggestions('location', value);
+
+    // Like the search box, only filter when a suggestion is picked or the box is cleared
+    if (!value || suggestions.location.some(suggestion => suggestion.text === value)) {
+      handleFilterChange('location', value);
+    }
+  };
+
+  const handleLocationKeyDown = (e) => {
+    if (e.key === 'Enter') {
+      handleFilterChange('location', locationInput);
+    }
+  };
+
   const handleFilterChange = (key, value) => {
     setFilters(prev => ({
       ...prev,
@@ -102,6 +169,8 @@ const FindItems = () => {
       dateTo: ''
     });
     setSearchTerm('');
+    setSearchInput('');
+    setLocationInput('');
     setPagination(prev => ({ ...prev, page: 1 }));
   };
 
@@ -211,16 +280,22 @@ const FindItems = () => {
         <div className="card mb-8">
           <div className="flex flex-col lg:flex-row gap-4">
             {/* Search Bar */}
-            <div className="flex-1 relative">
+            <form onSubmit={handleSearchSubmit} className="flex-1 relative">
               <Search size={20} className="absolute left-3 top-3 text-gray-400" />
               <input
                 type="text"
                 placeholder="Search items, descriptions, or locations..."
-                value={searchTerm}
+                value={searchInput}
                 onChange={handleSearchChange}
+                list="title-suggestions"
                 className="input-field pl-10 w-full"
               />
-            </div>
+              <datalist id="title-suggestions">
+                {suggestions.title.map(suggestion => (
+                  <option key={suggestion.text} value={suggestion.text} />
+                ))}
+              </datalist>
+            </form>
 
             {/* Controls */}
             <div className="flex items-center space-x-4">
@@ -287,10 +362,17 @@ const FindItems = () => {
                   <input
                     type="text"
                     placeholder="Filter by location"
-                    value={filters.location}
-                    onChange={(e) => handleFilterChange('location', e.target.value)}
+                    value={locationInput}
+                    onChange={handleLocationChange}
+                    onKeyDown={handleLocationKeyDown}
+                    list="location-suggestions"
                     className="input-field"
                   />
+                  <datalist id="location-suggestions">
+                    {suggestions.location.map(suggestion => (
+                      <option key={suggestion.text} value={suggestion.text} />
+                    ))}
+                  </datalist>
                 </div>
 
                 <div>
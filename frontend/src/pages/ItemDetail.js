@@ -25,6 +25,7 @@ const ItemDetail = () => {
   const [showMessageModal, setShowMessageModal] = useState(false);
   const [message, setMessage] = useState('');
   const [sendingMessage, setSendingMessage] = useState(false);
+  const [updatingStatus, setUpdatingStatus] = useState(false);
 
   useEffect(() => {
     fetchItemDetails();
@@ -43,6 +44,19 @@ const ItemDetail = () => {
     }
   };
 
+  const handleStatusChange = async (status) => {
+    setUpdatingStatus(true);
+    try {
+      await itemsAPI.updateItemStatus(item.id, status);
+      setItem(prev => ({ ...prev, status }));
+      toast.success('Item status updated');
+    } catch (error) {
+      console.error('Failed to update item status:', error);
+    } finally {
+      setUpdatingStatus(false);
+    }
+  };
+
   const handleSendMessage = async (e) => {
     e.preventDefault();
     if (!message.trim()) return;
@@ -291,6 +305,34 @@ const ItemDetail = () => {
                 <p className="text-sm text-green-800">
                   Check your messages regularly for people who might have found your item.
                 </p>
+                {item.status !== 'closed' && (
+                  <div className="flex space-x-3 mt-4">
+                    {item.status === 'active' ? (
+                      <button
+                        onClick={() => handleStatusChange('found')}
+                        className="btn-primary flex-1"
+                        disabled={updatingStatus}
+                      >
+                        Mark as Found
+                      </button>
+                    ) : (
+                      <button
+                        onClick={() => handleStatusChange('active')}
+                        className="btn-secondary flex-1"
+                        disabled={updatingStatus}
+                      >
+                        Reopen
+                      </button>
+                    )}
+                    <button
+                      onClick={() => handleStatusChange('closed')}
+                      className="btn-secondary flex-1"
+                      disabled={updatingStatus}
+                    >
+                      Close Listing
+                    </button>
+                  </div>
+                )}
               </div>
             )}
           </div>
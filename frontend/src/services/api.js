@@ -70,9 +70,19 @@ export const itemsAPI = {
     return api.get(`/api/items/lost/${itemId}`);
   },
   
+  updateItemStatus: (itemId, status) => {
+    const formData = new FormData();
+    formData.append('status', status);
+    return api.put(`/api/items/lost/${itemId}/status`, formData);
+  },
+  
   getCategories: () => {
     return api.get('/api/categories');
   },
+  
+  getSuggestions: (field, q, limit = 8) => {
+    return api.get('/api/suggest', { params: { field, q, limit } });
+  },
 };
 
 export const messagesAPI = {